@@ -137,7 +137,11 @@ CREATE TABLE product_sales (
     quantity FLOAT NOT NULL,
     base_price FLOAT NOT NULL,
     total_price FLOAT NOT NULL,
-    observations VARCHAR(300)
+    observations VARCHAR(300),
+    -- Denormalized from products.name / sales.sale_status_desc so the
+    -- top-products query reads a single table (kept in sync by triggers)
+    product_name VARCHAR(500),
+    sale_completed BOOLEAN
 );
 
 -- Items added to products (e.g., "Hamburguer + Bacon + Queijo extra")
@@ -233,4 +237,113 @@ CREATE TABLE coupon_sales (
     value FLOAT,
     target VARCHAR(100),
     sponsorship VARCHAR(100)
-);
\ No newline at end of file
+);
+-- =========================================================================
+-- INDEXES (dashboard queries)
+-- =========================================================================
+-- Every dashboard query filters sale_status_desc = 'COMPLETED' and most
+-- also filter created_at >= X. The partial covering index below lets the
+-- general-metrics query (and the materialized-view refreshes) run as
+-- index-only scans instead of sequential scans over sales.
+
+CREATE INDEX sales_completed_created_at_idx
+    ON sales (created_at)
+    INCLUDE (total_amount, id)
+    WHERE sale_status_desc = 'COMPLETED';
+
+-- Index-only scan for the denormalized top-products query.
+CREATE INDEX ps_completed_product_name_idx
+    ON product_sales (product_name)
+    INCLUDE (quantity, total_price)
+    WHERE sale_completed;
+
+-- =========================================================================
+-- TRIGGERS (denormalized product_sales columns)
+-- =========================================================================
+-- product_sales.product_name / sale_completed are copies of
+-- products.name / sales.sale_status_desc = 'COMPLETED'. Filled on insert
+-- and kept in sync when either parent row changes, so the top-products
+-- query never needs the 3-table join.
+--
+-- Backfill for databases created before these columns existed:
+--   UPDATE product_sales ps SET product_name = p.name
+--     FROM products p WHERE p.id = ps.product_id;
+--   UPDATE product_sales ps
+--     SET sale_completed = (s.sale_status_desc = 'COMPLETED')
+--     FROM sales s WHERE s.id = ps.sale_id;
+
+CREATE FUNCTION product_sales_denormalize() RETURNS trigger AS $$
+BEGIN
+    SELECT name INTO NEW.product_name
+    FROM products WHERE id = NEW.product_id;
+
+    SELECT sale_status_desc = 'COMPLETED' INTO NEW.sale_completed
+    FROM sales WHERE id = NEW.sale_id;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER product_sales_denormalize_trg
+    BEFORE INSERT OR UPDATE OF product_id, sale_id ON product_sales
+    FOR EACH ROW EXECUTE FUNCTION product_sales_denormalize();
+
+CREATE FUNCTION sales_propagate_status() RETURNS trigger AS $$
+BEGIN
+    UPDATE product_sales
+    SET sale_completed = (NEW.sale_status_desc = 'COMPLETED')
+    WHERE sale_id = NEW.id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER sales_propagate_status_trg
+    AFTER UPDATE OF sale_status_desc ON sales
+    FOR EACH ROW EXECUTE FUNCTION sales_propagate_status();
+
+CREATE FUNCTION products_propagate_name() RETURNS trigger AS $$
+BEGIN
+    UPDATE product_sales
+    SET product_name = NEW.name
+    WHERE product_id = NEW.id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER products_propagate_name_trg
+    AFTER UPDATE OF name ON products
+    FOR EACH ROW EXECUTE FUNCTION products_propagate_name();
+
+-- =========================================================================
+-- MATERIALIZED VIEWS (pre-aggregated dashboard data)
+-- =========================================================================
+-- The hourly and day-of-week dashboards re-aggregated the whole sales
+-- table on every request. These views hold the result and the API reads
+-- them with trivial index scans. They materialize empty at initdb time
+-- (the generator runs later): generate_data.py refreshes them after the
+-- initial load and the API's background loop (dashboard_refresh_loop in
+-- app.py) re-runs REFRESH ... CONCURRENTLY every 30 s from then on.
+
+CREATE MATERIALIZED VIEW mv_sales_by_hour AS
+SELECT
+    TO_CHAR(created_at, 'HH24:00h') AS hour,
+    COUNT(id)::int AS pedidos
+FROM sales
+WHERE sale_status_desc = 'COMPLETED'
+GROUP BY 1;
+
+-- Unique index required by REFRESH ... CONCURRENTLY
+CREATE UNIQUE INDEX mv_sales_by_hour_pk ON mv_sales_by_hour (hour);
+
+-- One row per calendar day so the API can still filter by period
+-- (7d/30d/month/6m) before summing per weekday.
+CREATE MATERIALIZED VIEW mv_revenue_by_day AS
+SELECT
+    created_at::date AS sale_date,
+    EXTRACT(ISODOW FROM created_at)::int AS day_order,
+    SUM(total_amount)::bigint AS total_revenue
+FROM sales
+WHERE sale_status_desc = 'COMPLETED'
+GROUP BY 1, 2;
+
+CREATE UNIQUE INDEX mv_revenue_by_day_pk ON mv_revenue_by_day (sale_date);